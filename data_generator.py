@@ -6,7 +6,7 @@ import random
 import time
 import csv
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MarketDataPoint:
     timestamp: datetime.datetime
     symbol: str
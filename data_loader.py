@@ -2,10 +2,30 @@
 from __future__ import annotations
 from dataclasses import dataclass
 from datetime import datetime
-from typing import List
+from typing import Iterator, List, Optional, Tuple
 import csv
+import heapq
+import sys
+from operator import attrgetter
 
-@dataclass(frozen=True)
+try:
+    import polars as pl
+except ImportError:  # optional fast path; pyarrow/csv fallbacks below
+    pl = None
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    import pyarrow.compute as pa_compute
+except ImportError:
+    pa = None
+
+try:
+    import numpy as _np
+except ImportError:
+    _np = None
+
+@dataclass(frozen=True, slots=True)
 class MarketDataPoint:
     timestamp: datetime
     symbol: str
@@ -14,17 +34,150 @@ class MarketDataPoint:
 class MarketDataReader:
     def __init__(self, csv_path: str):
         self.csv_path = csv_path
-        self._data: List[MarketDataPoint] = []
+        self._df = None     # polars DataFrame when polars is available
+        self._table = None  # pyarrow Table (zero-copy columnar buffers)
+        self._cols = None   # plain numpy SoA columns (numpy-only fallback)
+        self._data: Optional[List[MarketDataPoint]] = None
 
     def read_data(self) -> None:
+        if pl is not None:
+            # Vectorized ingest: parse and type all columns in one pass,
+            # then a single columnar sort instead of a Python key-sort.
+            self._df = pl.read_csv(
+                self.csv_path,
+                schema={"timestamp": pl.Datetime("us"), "symbol": pl.Categorical, "price": pl.Float64},
+            ).sort("timestamp")
+            self._table = self._df.to_arrow()  # zero-copy view of the same buffers
+            self._data = None
+            return
+        if pa is not None:
+            # Arrow's C++ CSV reader: typed columns, dictionary-encoded symbols
+            table = pa_csv.read_csv(
+                self.csv_path,
+                convert_options=pa_csv.ConvertOptions(column_types={
+                    "timestamp": pa.timestamp("us"),
+                    "symbol": pa.dictionary(pa.int32(), pa.string()),
+                    "price": pa.float64(),
+                }),
+            )
+            order = pa_compute.sort_indices(table, sort_keys=[("timestamp", "ascending")])
+            self._table = table.take(order)
+            self._data = None
+            return
+        if _np is not None:
+            # No Arrow backend, but numpy is here: read the raw string
+            # columns in one tight loop, then parse all timestamps with a
+            # single vectorized datetime64 conversion instead of N
+            # datetime.fromisoformat calls.
+            self._read_columns_numpy()
+            return
+        # Fallback: pure-stdlib parse
+        data = list(self._iter_file(self.csv_path, {}))
+        data.sort(key=attrgetter("timestamp"))
+        self._data = data
+
+    def _read_columns_numpy(self) -> None:
+        ts_strs: List[str] = []
+        sym_codes: List[int] = []
+        px_strs: List[str] = []
+        sym_ids: dict = {}
         with open(self.csv_path, newline='') as f:
-            reader = csv.DictReader(f)
+            reader = csv.reader(f)
+            header = next(reader, None)
+            if header is None:
+                self._cols = (_np.empty(0, "int64"), _np.empty(0, "int32"), [], _np.empty(0))
+                self._data = None
+                return
+            i_ts, i_sym, i_px = header.index("timestamp"), header.index("symbol"), header.index("price")
+            ts_append, code_append, px_append = ts_strs.append, sym_codes.append, px_strs.append
+            ids_get = sym_ids.get
+            for row in reader:
+                raw = row[i_sym].strip()
+                code = ids_get(raw)
+                if code is None:
+                    code = sym_ids.setdefault(sys.intern(raw), len(sym_ids))
+                ts_append(row[i_ts])
+                code_append(code)
+                px_append(row[i_px])
+        ts = _np.array(ts_strs, dtype="datetime64[us]")
+        order = _np.argsort(ts, kind="stable")
+        self._cols = (
+            ts.view("int64")[order],
+            _np.asarray(sym_codes, dtype="int32")[order],
+            list(sym_ids),
+            _np.array(px_strs, dtype=_np.float64)[order],
+        )
+        self._data = None
+
+    @staticmethod
+    def _iter_file(path: str, sym_cache: dict) -> Iterator[MarketDataPoint]:
+        """Yield MarketDataPoint per row in file order. Tuned for the hot
+        loop — positional csv.reader (no per-row dict), callables hoisted
+        to locals, tickers interned through sym_cache so each symbol is
+        one shared str object."""
+        with open(path, newline='') as f:
+            reader = csv.reader(f)
+            header = next(reader, None)
+            if header is None:
+                return
+            i_ts, i_sym, i_px = header.index("timestamp"), header.index("symbol"), header.index("price")
+            fromiso = datetime.fromisoformat  # e.g., 2025-09-20T14:30:22.051736
+            point = MarketDataPoint
+            cache_get = sym_cache.get
             for row in reader:
-                ts = datetime.fromisoformat(row["timestamp"])  # e.g., 2025-09-20T14:30:22.051736
-                sym = row["symbol"].strip()
-                px = float(row["price"])
-                self._data.append(MarketDataPoint(ts, sym, px))
-        self._data.sort(key=lambda d: d.timestamp)
+                raw = row[i_sym].strip()
+                sym = cache_get(raw)
+                if sym is None:
+                    sym = sym_cache.setdefault(raw, sys.intern(raw))
+                yield point(fromiso(row[i_ts]), sym, float(row[i_px]))
+
+    def read_many(self, paths: List[str]) -> None:
+        """Read several CSVs that are each already timestamp-sorted (e.g.
+        per-symbol or per-day shards) and merge them lazily with
+        heapq.merge — O(N log K) instead of concatenate-and-resort."""
+        sym_cache: dict = {}
+        streams = [self._iter_file(p, sym_cache) for p in paths]
+        self._df = None
+        self._table = None
+        self._data = list(heapq.merge(*streams, key=attrgetter("timestamp")))
+
+    def fetch_columns(self):
+        """Return SoA columns (ts_us:int64, sym_codes:int32, sym_dict:list, price:float64).
+
+        Arrays are numpy views over the Arrow buffers where possible, so no
+        per-row Python objects are created.
+        """
+        if self._table is None:
+            if self._cols is not None:
+                return self._cols
+            raise RuntimeError("fetch_columns requires a columnar backend (polars, pyarrow or numpy)")
+        ts_col = self._table.column("timestamp").combine_chunks()
+        sym_col = self._table.column("symbol").combine_chunks()
+        px_col = self._table.column("price").combine_chunks()
+        ts_us = ts_col.to_numpy(zero_copy_only=False).view("int64")
+        sym_codes = sym_col.indices.to_numpy(zero_copy_only=False)
+        sym_dict = sym_col.dictionary.to_pylist()
+        px = px_col.to_numpy(zero_copy_only=False)
+        return ts_us, sym_codes, sym_dict, px
+
+    def iter_rows(self) -> Iterator[Tuple[datetime, str, float]]:
+        """Yield (timestamp, symbol, price) tuples without building dataclasses."""
+        if self._df is not None:
+            yield from self._df.iter_rows()
+        elif self._table is not None:
+            cols = self._table.to_pydict()
+            yield from zip(cols["timestamp"], cols["symbol"], cols["price"])
+        elif self._cols is not None:
+            ts_us, codes, sym_dict, px = self._cols
+            # bulk int64->datetime conversion, then plain Python iteration
+            stamps = ts_us.view("datetime64[us]").tolist()
+            yield from zip(stamps, (sym_dict[c] for c in codes), px.tolist())
+        elif self._data is not None:
+            for d in self._data:
+                yield d.timestamp, d.symbol, d.price
 
     def fetch_data(self) -> List[MarketDataPoint]:
-        return list(self._data)
+        if self._data is None and (self._df is not None or self._table is not None or self._cols is not None):
+            # Materialize dataclasses lazily, only when a caller needs them
+            self._data = [MarketDataPoint(ts, sym, px) for ts, sym, px in self.iter_rows()]
+        return list(self._data) if self._data is not None else []
@@ -1,57 +1,291 @@
 
 from __future__ import annotations
 from typing import Iterable, List, Dict, Tuple
+import itertools
 import random
+import sys
+from operator import attrgetter
 
-from models import Order, OrderError, ExecutionError, MarketDataContainer, MarketDataPoint
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from models import Order, MarketDataContainer, MarketDataPoint, MarketDataView, us_to_datetime
 from strategies import Strategy
 
+
+class _ChunkedList:
+    """Append-only sequence stored as fixed-size chunks.
+
+    Long runs log millions of orders/errors; growing one giant list
+    triggers periodic realloc+copy of the whole pointer array. Chunks
+    bound every grow to chunk_size and report()/iteration just chains
+    them once at the end.
+    """
+    __slots__ = ("_chunks", "_chunk_size", "_n")
+
+    def __init__(self, chunk_size: int = 65536) -> None:
+        self._chunk_size = chunk_size
+        self._chunks: List[list] = [[]]
+        self._n = 0
+
+    def append(self, item) -> None:
+        chunk = self._chunks[-1]
+        if len(chunk) == self._chunk_size:
+            chunk = []
+            self._chunks.append(chunk)
+        chunk.append(item)
+        self._n += 1
+
+    def __len__(self) -> int:
+        return self._n
+
+    def __bool__(self) -> bool:
+        return self._n > 0
+
+    def __iter__(self):
+        return itertools.chain.from_iterable(self._chunks)
+
+
 class BackTestengine:
     """Ticks -> signals -> orders -> fills -> positions, with resilient logging."""
-    def __init__(self, strategies: Iterable[Strategy]) -> None:
+    OUTAGE_RATE = 0.03  # simulated probability of a venue outage per order
+
+    def __init__(self, strategies: Iterable[Strategy], rng=None) -> None:
         self.strategies: List[Strategy] = list(strategies)
-        self.container = MarketDataContainer()  # holds buffer, positions, signals
-        self.order_log: List[Order] = []
-        self.error_log: List[str] = []
+        # Bound the tick buffer to the deepest strategy lookback, so memory
+        # stays O(max window) instead of O(total ticks); strategies that do
+        # not advertise a lookback leave it unbounded
+        lookbacks = [getattr(s, "lookback", None) for s in self.strategies]
+        max_lookback = max((lb for lb in lookbacks if lb), default=None)
+        maxlen = max_lookback if all(lookbacks) else None
+        self.container = MarketDataContainer(maxlen=maxlen)  # holds buffer, positions, signals
+        # Order log kept as parallel columns (SoA) so report() can build its
+        # output in one zip pass instead of holding N Order objects alive
+        self._ord_times = _ChunkedList()
+        self._ord_syms = _ChunkedList()
+        self._ord_sides = _ChunkedList()
+        self._ord_qtys = _ChunkedList()
+        self._ord_pxs = _ChunkedList()
+        self._ord_status = _ChunkedList()
+        self.error_log = _ChunkedList()
+        # Dispatch table: symbol -> strategies that trade it; strategies with
+        # no .symbol attribute are treated as global and run on every tick
+        self._by_sym: Dict[str, List[Strategy]] = {}
+        self._global_strategies: List[Strategy] = []
+        for strat in self.strategies:
+            sym = getattr(strat, "symbol", None)
+            if sym is None:
+                self._global_strategies.append(strat)
+            else:
+                self._by_sym.setdefault(sym, []).append(strat)
+        self._rng = rng  # numpy Generator; defaults lazily to np.random.default_rng()
+        self._reject_mask = None  # pre-sampled outage decisions, one per order
+        self._order_idx = 0
 
     # ---- lifecycle ----
     def on_tick(self, tick: MarketDataPoint) -> None:
         self.container.buffer_data(tick)
         positions = self.container.positions  # schema: quantity + avg_price
 
-        for strat in self.strategies:
+        strategies = self._by_sym.get(tick.symbol)
+        if self._global_strategies:
+            strategies = (strategies or []) + self._global_strategies
+        for strat in strategies or ():
+            # Strategies are third-party code, so keep one guard around them;
+            # validation and execution below use plain branches instead
             try:
                 signals = strat.generate_signals(tick, positions) or []
+            except Exception as ex:
+                self.error_log.append(f"{tick.timestamp} Strategy {type(strat).__name__} error: {ex}")
+                continue
+            if not signals:
+                continue
+
+            for order in self._create_orders(signals, tick):
+                self._execute(order)
+                self._log_order(order)
+
+    def feed_batch(self, ticks) -> None:
+        """Process a burst of ticks in one call frame.
+
+        Same semantics as calling on_tick per element, but the per-tick
+        lookups (container method, dispatch table, logs) are bound once
+        per burst, so a feed handing over 10-1000 ticks at a time pays
+        one frame of setup instead of one per tick.
+        """
+        buffer_data = self.container.buffer_data
+        positions = self.container.positions
+        get_strategies = self._by_sym.get
+        global_strategies = self._global_strategies
+        create_orders = self._create_orders
+        execute = self._execute
+        log_order = self._log_order
+        log_error = self.error_log.append
+        for tick in ticks:
+            buffer_data(tick)
+            strategies = get_strategies(tick.symbol)
+            if global_strategies:
+                strategies = (strategies or []) + global_strategies
+            for strat in strategies or ():
+                try:
+                    signals = strat.generate_signals(tick, positions) or []
+                except Exception as ex:
+                    log_error(f"{tick.timestamp} Strategy {type(strat).__name__} error: {ex}")
+                    continue
                 if not signals:
                     continue
+                for order in create_orders(signals, tick):
+                    execute(order)
+                    log_order(order)
+
+    def run(self, market: Iterable[MarketDataPoint], assume_sorted: bool = False) -> None:
+        if assume_sorted:
+            # Caller guarantees timestamp order (e.g. MarketDataReader sorts
+            # on load) — skip the redundant O(N log N) pass entirely.
+            ticks = market if isinstance(market, list) else list(market)
+            self._prepare_reject_mask(len(ticks))
+            self.feed_batch(ticks)
+            return
+        # C-level key extraction (attrgetter) and an in-place sort when the
+        # caller handed us a list — no copy, no per-key Python frame
+        if isinstance(market, list):
+            ticks = market
+            ticks.sort(key=attrgetter("timestamp"))
+        else:
+            ticks = sorted(market, key=attrgetter("timestamp"))
+        self._prepare_reject_mask(len(ticks))
+        self.feed_batch(ticks)
+
+    def run_columns(self, ts_us, sym_codes, sym_dict, price) -> None:
+        """Consume SoA columns (already timestamp-sorted by the reader).
 
-                orders = self._create_orders(signals, tick)
-                for order in orders:
+        Ticks are handed to strategies as MarketDataView objects, so no
+        dataclass or datetime is built per row.
+        """
+        symbols = [sys.intern(str(s)) for s in sym_dict]  # pre-decode + intern the symbol dictionary
+        self._prepare_reject_mask(len(ts_us))
+        n = len(ts_us)
+        if np is None or n == 0:
+            on_tick = self.on_tick
+            view = MarketDataView
+            for i in range(n):
+                on_tick(view(int(ts_us[i]), symbols[sym_codes[i]], float(price[i])))
+            return
+
+        # Feeds are bursty per symbol: group contiguous runs of the same
+        # sym_id and hoist all per-symbol lookups out of the inner loop
+        bounds = np.flatnonzero(np.diff(sym_codes) != 0) + 1
+        starts = np.concatenate(([0], bounds))
+        stops = np.concatenate((bounds, [n]))
+        view = MarketDataView
+        buffer_data = self.container.buffer_data
+        positions = self.container.positions
+        create_orders = self._create_orders
+        execute = self._execute
+        log_order = self._log_order
+        log_error = self.error_log.append
+        for start, stop in zip(starts, stops):
+            sym = symbols[sym_codes[start]]
+            strategies = self._by_sym.get(sym, [])
+            if self._global_strategies:
+                strategies = strategies + self._global_strategies
+            for i in range(start, stop):
+                tick = view(int(ts_us[i]), sym, float(price[i]))
+                buffer_data(tick)
+                for strat in strategies:
                     try:
-                        self._execute(order)
+                        signals = strat.generate_signals(tick, positions) or []
                     except Exception as ex:
-                        order.status = "REJECTED"
-                        self.error_log.append(f"{tick.timestamp} {order.symbol} {order.side} x{order.quantity}: EXECUTION ERROR: {ex}")
-                    finally:
-                        self.order_log.append(order)
-            except Exception as ex:
-                self.error_log.append(f"{tick.timestamp} Strategy {type(strat).__name__} error: {ex}")
+                        log_error(f"{tick.timestamp} Strategy {type(strat).__name__} error: {ex}")
+                        continue
+                    if not signals:
+                        continue
+                    for order in create_orders(signals, tick):
+                        execute(order)
+                        log_order(order)
+
+    def _log_order(self, order: Order) -> None:
+        self._ord_times.append(order.timestamp)
+        self._ord_syms.append(order.symbol)
+        self._ord_sides.append(order.side)
+        self._ord_qtys.append(order.quantity)
+        self._ord_pxs.append(order.price)
+        self._ord_status.append(order.status)
 
-    def run(self, market: Iterable[MarketDataPoint]) -> None:
-        for tick in sorted(market, key=lambda t: t.timestamp):
-            self.on_tick(tick)
+    @property
+    def n_orders(self) -> int:
+        return len(self._ord_times)
 
-    def report(self) -> Dict:
+    def run_vectorized(self, ts_us, sym_codes, sym_dict, price) -> None:
+        """Precompute every strategy's signals with the vectorized kernels,
+        then replay only the (sparse) signal events in time order.
+
+        Position-aware SELL sizing and the outage simulation still happen
+        sequentially at replay, so results match the per-tick loop exactly.
+        Falls back to run_columns when a strategy has no batch kernel.
+        """
+        if np is None:
+            self.run_columns(ts_us, sym_codes, sym_dict, price)
+            return
+        symbols = [sys.intern(str(s)) for s in sym_dict]
+        sym_index = {s: i for i, s in enumerate(symbols)}
+        self._prepare_reject_mask(len(ts_us))
+
+        events: List[Tuple[int, int, int]] = []  # (tick_idx, strategy_rank, signal)
+        for rank, strat in enumerate(self.strategies):
+            sym = getattr(strat, "symbol", None)
+            if sym is None:
+                self.run_columns(ts_us, sym_codes, sym_dict, price)
+                return
+            sid = sym_index.get(sym)
+            if sid is None:
+                continue  # no ticks for this strategy's symbol
+            rows = np.flatnonzero(sym_codes == sid)
+            sig = strat.precompute(price[rows])
+            if sig is None:
+                self.run_columns(ts_us, sym_codes, sym_dict, price)
+                return
+            for j in np.flatnonzero(sig):
+                events.append((int(rows[j]), rank, int(sig[j])))
+        events.sort()
+
+        positions = self.container.positions
+        for i, rank, s in events:
+            strat = self.strategies[rank]
+            sym = strat.symbol
+            px = float(price[i])
+            if s > 0:
+                side, qty = "BUY", strat.trade_qty
+            else:
+                held = int(positions.get(sym, {}).get("quantity", 0))
+                side, qty = "SELL", min(strat.trade_qty, held)
+                if qty <= 0:
+                    continue
+            order = Order(side=side, symbol=sym, quantity=qty, price=px,
+                          timestamp=us_to_datetime(int(ts_us[i])))
+            self._execute(order)
+            self._log_order(order)
+
+    def report(self, deepcopy: bool = False) -> Dict:
+        # positions defaults to the live read-only Mapping view (zero copies);
+        # callers that mutate or serialize the result opt into deepcopy=True
+        positions = self.container.positions
+        if deepcopy:
+            positions = {k: dict(v) for k, v in positions.items()}
         return {
-            "positions": {k: v.copy() for k, v in self.container.positions.items()},
+            "positions": positions,
             "orders": [{
-                "time": o.timestamp.isoformat(),
-                "symbol": o.symbol,
-                "side": o.side,
-                "qty": o.quantity,
-                "price": o.price,
-                "status": o.status
-            } for o in self.order_log],
+                "time": t.isoformat(),
+                "symbol": sym,
+                "side": side,
+                "qty": qty,
+                "price": px,
+                "status": status
+            } for t, sym, side, qty, px, status in zip(
+                self._ord_times, self._ord_syms, self._ord_sides,
+                self._ord_qtys, self._ord_pxs, self._ord_status)],
             "errors": list(self.error_log),
         }
 
@@ -65,17 +299,50 @@ class BackTestengine:
             elif len(s) == 4:
                 side, symbol, qty, price = s
             else:
-                raise OrderError(f"Bad signal shape: {s}")
-            o = Order(side=str(side).upper(), symbol=symbol, quantity=int(qty), price=float(price), timestamp=tick.timestamp)
-            o.validate()
+                self.error_log.append(f"{tick.timestamp} Bad signal shape: {s}")
+                continue
+            # Signal payloads are third-party data like the strategies that
+            # emit them: a non-numeric qty/price is logged and skipped, never
+            # allowed to abort the run
+            try:
+                # is_valid() normalizes side, so no duplicate upper() here
+                o = Order(side=str(side), symbol=symbol, quantity=int(qty), price=float(price), timestamp=tick.timestamp)
+            except (TypeError, ValueError) as ex:
+                self.error_log.append(f"{tick.timestamp} {symbol} {side} x{qty}: ORDER ERROR: {ex}")
+                continue
+            ok, reason = o.is_valid()
+            if not ok:
+                self.error_log.append(f"{tick.timestamp} {symbol} {side} x{qty}: ORDER ERROR: {reason}")
+                continue
             orders.append(o)
         return orders
 
-    def _execute(self, order: Order) -> None:
-        # Simulate flaky fills 3% of the time
-        if random.random() < 0.03:
-            raise ExecutionError("Simulated venue outage")
+    def _prepare_reject_mask(self, n_ticks: int) -> None:
+        """Pre-sample all outage decisions in one vectorized draw."""
+        if np is None:
+            return
+        rng = self._rng if self._rng is not None else np.random.default_rng()
+        estimate = max(n_ticks * max(len(self.strategies), 1), 1)
+        self._reject_mask = rng.random(estimate) < self.OUTAGE_RATE
+        self._order_idx = 0
+
+    def _execute(self, order: Order) -> bool:
+        # Simulate flaky fills OUTAGE_RATE of the time; decisions come from
+        # the pre-sampled mask, with a scalar draw if it is absent/exhausted
+        mask = self._reject_mask
+        if mask is not None and self._order_idx < len(mask):
+            rejected = bool(mask[self._order_idx])
+            self._order_idx += 1
+        else:
+            rejected = random.random() < self.OUTAGE_RATE
+        if rejected:
+            order.status = "REJECTED"
+            self.error_log.append(
+                f"{order.timestamp} {order.symbol} {order.side} x{order.quantity}: "
+                f"EXECUTION ERROR: Simulated venue outage")
+            return False
         # Fill at provided price
         order.status = "FILLED"
         # apply to positions (quantity + avg_price schema)
         self.container.apply_fill(order)
+        return True
@@ -0,0 +1,112 @@
+"""
+Vectorized signal kernels.
+
+These functions reproduce the per-tick logic of the strategies in
+strategies.py as single numpy passes over a whole price column, for use
+by batch/backtest paths where the per-tick Python event loop is too
+slow. Signals are returned as an int8 array aligned to the input ticks:
++1 = BUY signal, -1 = SELL signal (before any position gating), 0 = none.
+"""
+
+from __future__ import annotations
+import numpy as np
+
+
+def rolling_mean(prices: np.ndarray, window: int) -> np.ndarray:
+    """Simple moving average via a shared prefix-sum; valid from index window-1."""
+    cs = np.concatenate(([0.0], np.cumsum(prices, dtype=np.float64)))
+    return (cs[window:] - cs[:-window]) / window
+
+
+def ma_crossover_signals(prices: np.ndarray, short_window: int, long_window: int) -> np.ndarray:
+    """
+    Crossover signals matching MovingAverageCrossover.generate_signals:
+    BUY when the short-long MA difference crosses from <=0 to >0, SELL on
+    the opposite crossing. The first possible signal is at tick index
+    long_window (one tick after both windows are first full).
+    """
+    n = len(prices)
+    sig = np.zeros(n, dtype=np.int8)
+    if n < long_window + 1:
+        return sig
+    short_ma = rolling_mean(prices, short_window)
+    long_ma = rolling_mean(prices, long_window)
+    # Align both to ticks long_window-1 .. n-1
+    diff = short_ma[long_window - short_window:] - long_ma
+    prev, cur = diff[:-1], diff[1:]
+    idx = np.arange(long_window, n)
+    sig[idx[(prev <= 0) & (cur > 0)]] = 1
+    sig[idx[(prev >= 0) & (cur < 0)]] = -1
+    return sig
+
+
+def ma_crossover_sweep(prices: np.ndarray, shorts, longs) -> np.ndarray:
+    """
+    Crossover signals for every (short, long) parameter pair at once.
+
+    All pairs share one prefix sum, and each distinct window's rolling
+    mean is computed a single time and reused across pairs, so a sweep
+    over a (shorts x longs) grid costs O(N * distinct_windows) instead of
+    O(N * pairs). Row i of the returned (pairs, n) int8 array equals
+    ma_crossover_signals(prices, shorts[i], longs[i]).
+    """
+    prices = np.asarray(prices, dtype=np.float64)
+    n = len(prices)
+    shorts = np.asarray(shorts, dtype=np.int64)
+    longs = np.asarray(longs, dtype=np.int64)
+    if len(shorts) != len(longs):
+        raise ValueError("shorts and longs must have the same length")
+    cs = np.concatenate(([0.0], np.cumsum(prices, dtype=np.float64)))
+    ma_cache: dict = {}
+    out = np.zeros((len(shorts), n), dtype=np.int8)
+    for r in range(len(shorts)):
+        sw, lw = int(shorts[r]), int(longs[r])
+        if not 1 <= sw < lw:
+            raise ValueError("Require 1 <= short_window < long_window")
+        if n < lw + 1:
+            continue
+        short_ma = ma_cache.get(sw)
+        if short_ma is None:
+            short_ma = ma_cache[sw] = (cs[sw:] - cs[:-sw]) / sw
+        long_ma = ma_cache.get(lw)
+        if long_ma is None:
+            long_ma = ma_cache[lw] = (cs[lw:] - cs[:-lw]) / lw
+        diff = short_ma[lw - sw:] - long_ma
+        prev, cur = diff[:-1], diff[1:]
+        idx = np.arange(lw, n)
+        row = out[r]
+        row[idx[(prev <= 0) & (cur > 0)]] = 1
+        row[idx[(prev >= 0) & (cur < 0)]] = -1
+    return out
+
+
+def signal_events(signals: np.ndarray, prices: np.ndarray):
+    """Compress a per-tick int8 signal array into aligned event columns.
+
+    Returns (sides, event_prices, indices): the "BUY"/"SELL" labels, tick
+    prices and tick indices of the nonzero signals, in tick order.
+    """
+    idx = np.flatnonzero(signals)
+    sides = np.where(signals[idx] > 0, "BUY", "SELL")
+    return sides, np.asarray(prices, dtype=np.float64)[idx], idx
+
+
+def momentum_signals(prices: np.ndarray, lookback: int, threshold_pct: float) -> np.ndarray:
+    """
+    Momentum signals matching Momentum.generate_signals: BUY when the
+    lookback return is >= threshold_pct, SELL when <= -threshold_pct.
+    Ticks whose lookback price is <= 0 produce no signal. Uses the same
+    division-free factor comparison as the streaming path (now vs
+    past * (1 +/- threshold)) so both stay bit-consistent.
+    """
+    n = len(prices)
+    sig = np.zeros(n, dtype=np.int8)
+    if n <= lookback:
+        return sig
+    past = prices[:-lookback]
+    now = prices[lookback:]
+    valid = past > 0
+    tail = sig[lookback:]
+    tail[valid & (now >= past * (1.0 + threshold_pct))] = 1
+    tail[valid & (now <= past * (1.0 - threshold_pct))] = -1
+    return sig
@@ -20,14 +20,21 @@ def run_backtest(csv_path: str = None, generate_report: bool = True):
         import os
         csv_path = os.path.join(os.path.dirname(__file__), "market_data.csv")
     
-    # Load market data
+    # Load market data (SoA columns when a columnar backend is available)
     reader = MarketDataReader(csv_path)
     reader.read_data()
-    data = reader.fetch_data()
-    print(f"Loaded {len(data)} market data points")
-
-    # Initialize strategies
-    symbols = sorted({t.symbol for t in data})
+    try:
+        columns = reader.fetch_columns()
+    except RuntimeError:
+        columns = None
+    if columns is not None:
+        symbols = sorted(str(s) for s in columns[2])
+        n_points = len(columns[0])
+    else:
+        data = reader.fetch_data()
+        symbols = sorted({t.symbol for t in data})
+        n_points = len(data)
+    print(f"Loaded {n_points} market data points")
     strategies = []
     for sym in symbols:
         strategies.append(MovingAverageCrossover(symbol=sym, short_window=3, long_window=8, trade_qty=2))
@@ -37,8 +44,11 @@ def run_backtest(csv_path: str = None, generate_report: bool = True):
 
     # Run backtest
     engine = BackTestengine(strategies)
-    engine.run(data)
-    backtest_report = engine.report()
+    if columns is not None:
+        engine.run_vectorized(*columns)
+    else:
+        engine.run(data, assume_sorted=True)  # reader already sorts on load
+    backtest_report = engine.report(deepcopy=True)  # serialized/printed below
     
     print(f"Backtest completed. Generated {len(backtest_report['orders'])} orders")
     print(f"Final positions: {backtest_report['positions']}")
@@ -48,11 +58,12 @@ def run_backtest(csv_path: str = None, generate_report: bool = True):
     if generate_report:
         print("Generating performance report...")
         reporter = PerformanceReporter(initial_capital=10000.0, risk_free_rate=0.02)
-        report_content = reporter.generate_performance_report(backtest_report, "performance.md")
+        # Engine logs orders chronologically, so the reporter can skip re-sorting
+        report_content = reporter.generate_performance_report(backtest_report, "performance.md", assume_sorted=True)
         print("Performance report saved to performance.md")
-        
+
         # Calculate and display key metrics
-        metrics = reporter.calculate_performance(backtest_report)
+        metrics = reporter.calculate_performance(backtest_report, assume_sorted=True)
         print("\n" + "="*50)
         print("KEY PERFORMANCE METRICS")
         print("="*50)
@@ -1,8 +1,12 @@
 
 from __future__ import annotations
+from array import array
+from collections import deque
+from collections.abc import Mapping
 from dataclasses import dataclass
-from datetime import datetime
-from typing import Dict, List, Tuple, Optional
+from itertools import islice
+from datetime import datetime, timedelta
+from typing import Deque, Dict, List, Tuple, Optional
 
 
 class OrderError(Exception):
@@ -12,13 +16,40 @@ class ExecutionError(Exception):
     pass
 
 
-@dataclass(frozen=True)
+_VALID_SIDES = frozenset(("BUY", "SELL"))
+
+
+@dataclass(frozen=True, slots=True)
 class MarketDataPoint:
     timestamp: datetime
     symbol: str
     price: float
 
-@dataclass
+
+_EPOCH = datetime(1970, 1, 1)
+
+def us_to_datetime(us: int) -> datetime:
+    """Convert int64 microseconds-since-epoch (the SoA timestamp unit) to a naive datetime."""
+    return _EPOCH + timedelta(microseconds=us)
+
+class MarketDataView:
+    """
+    Lightweight tick backed by SoA columns (int64 microseconds, str, float).
+    Quacks like MarketDataPoint but only materializes a datetime when
+    .timestamp is actually read (order creation / error logging).
+    """
+    __slots__ = ("ts_us", "symbol", "price")
+
+    def __init__(self, ts_us: int, symbol: str, price: float) -> None:
+        self.ts_us = ts_us
+        self.symbol = symbol
+        self.price = price
+
+    @property
+    def timestamp(self) -> datetime:
+        return us_to_datetime(self.ts_us)
+
+@dataclass(slots=True)
 class Order:
     side: str                  # "BUY" | "SELL"
     symbol: str
@@ -27,27 +58,68 @@ class Order:
     timestamp: datetime
     status: str = "NEW"        # "NEW" -> "FILLED"/"REJECTED"
 
-    def validate(self) -> None:
-        s = self.side.upper()
-        if s not in {"BUY","SELL"}:
-            raise OrderError(f"Invalid side: {self.side}")
+    def is_valid(self) -> Tuple[bool, str]:
+        """Normalize side and check the order; returns (ok, reason).
+
+        Branch-based twin of validate() for hot paths where raising and
+        catching OrderError per order is too expensive.
+        """
+        s = self.side if self.side in _VALID_SIDES else self.side.upper()
+        if s not in _VALID_SIDES:
+            return False, f"Invalid side: {self.side}"
         if self.quantity <= 0:
-            raise OrderError("Quantity must be > 0")
+            return False, "Quantity must be > 0"
         if self.price <= 0:
-            raise OrderError("Price must be > 0")
+            return False, "Price must be > 0"
         if not self.symbol:
-            raise OrderError("Symbol is required")
+            return False, "Symbol is required"
         self.side = s
+        return True, ""
+
+    def validate(self) -> None:
+        ok, reason = self.is_valid()
+        if not ok:
+            raise OrderError(reason)
+
+class _PositionsView(Mapping):
+    """Read-only dict-like view over the container's SoA position arrays.
+
+    Entries are materialized on access, so strategies can keep using
+    positions.get(sym, {}).get("quantity", 0) without the container
+    paying for nested dicts on the fill path.
+    """
+    __slots__ = ("_container",)
+
+    def __init__(self, container: "MarketDataContainer") -> None:
+        self._container = container
+
+    def __getitem__(self, symbol: str) -> Dict[str, float]:
+        c = self._container
+        sid = c.sym_to_id[symbol]
+        return {"quantity": c._qty[sid], "avg_price": c._avg_px[sid]}
+
+    def __iter__(self):
+        return iter(self._container.sym_to_id)
+
+    def __len__(self) -> int:
+        return len(self._container.sym_to_id)
+
 
 class MarketDataContainer:
     """
-    - Buffer incoming MarketDataPoint instances in a list (self.buffer)
-    - Store open positions as {'SYM': {'quantity': int, 'avg_price': float}}
+    - Buffer incoming MarketDataPoint instances in self.buffer — a bounded
+      deque when maxlen is given (keeps only the working set strategies can
+      actually look back on), unbounded otherwise
+    - Store open positions as SoA arrays (qty, avg_px) indexed by symbol id;
+      self.positions is a read-only dict-like view over them
     - Collect signals as a list of tuples (action, symbol, qty, price)
     """
-    def __init__(self) -> None:
-        self.buffer: List[MarketDataPoint] = []
-        self.positions: Dict[str, Dict[str, float]] = {}
+    def __init__(self, maxlen: Optional[int] = None) -> None:
+        self.buffer: Deque[MarketDataPoint] = deque(maxlen=maxlen)
+        self.sym_to_id: Dict[str, int] = {}
+        self._qty = array("q")     # position quantity per symbol id
+        self._avg_px = array("d")  # average entry price per symbol id
+        self.positions = _PositionsView(self)
         self.signals: List[Tuple[str, str, int, float]] = []
 
     def buffer_data(self, data_point: MarketDataPoint) -> None:
@@ -57,7 +129,10 @@ class MarketDataContainer:
         return self.buffer[-1] if self.buffer else None
 
     def recent(self, n: int):
-        return self.buffer[-n:] if n > 0 else []
+        if n <= 0:
+            return []
+        size = len(self.buffer)
+        return list(islice(self.buffer, max(size - n, 0), size))
 
     def __len__(self) -> int:
         return len(self.buffer)
@@ -66,26 +141,31 @@ class MarketDataContainer:
         return iter(self.buffer)
 
     # position
-    def _ensure_pos(self, symbol: str) -> Dict[str, float]:
-        if symbol not in self.positions:
-            self.positions[symbol] = {"quantity": 0, "avg_price": 0.0}
-        return self.positions[symbol]
+    def _sym_id(self, symbol: str) -> int:
+        sid = self.sym_to_id.get(symbol)
+        if sid is None:
+            sid = len(self._qty)
+            self.sym_to_id[symbol] = sid
+            self._qty.append(0)
+            self._avg_px.append(0.0)
+        return sid
 
     def apply_fill(self, order: Order) -> None:
-        pos = self._ensure_pos(order.symbol)
+        sid = self._sym_id(order.symbol)
         q = int(order.quantity)
         px = float(order.price)
+        qty, avg_px = self._qty, self._avg_px
 
         if order.side == "BUY":
-            old_q = pos["quantity"]
+            old_q = qty[sid]
             new_q = old_q + q
-            pos["avg_price"] = (pos["avg_price"] * old_q + px * q) / new_q if new_q > 0 else 0.0
-            pos["quantity"] = new_q
+            avg_px[sid] = (avg_px[sid] * old_q + px * q) / new_q if new_q > 0 else 0.0
+            qty[sid] = new_q
         elif order.side == "SELL":
-            sell_q = min(q, pos["quantity"])
-            pos["quantity"] -= sell_q
-            if pos["quantity"] == 0:
-                pos["avg_price"] = 0.0
+            sell_q = min(q, qty[sid])
+            qty[sid] -= sell_q
+            if qty[sid] == 0:
+                avg_px[sid] = 0.0
 
     # signal
     def add_signal(self, action: str, symbol: str, qty: int, price: float) -> None:
@@ -9,11 +9,161 @@ a detailed performance report in Markdown format.
 from __future__ import annotations
 from typing import Dict, List, Tuple, Optional
 import math
-import statistics
+import os
+from collections import Counter
 from datetime import datetime, timedelta
+from bisect import bisect_left, bisect_right
+from operator import itemgetter
 from dataclasses import dataclass
 import json
 
+try:
+    import numpy as np  # metric/report math is numpy-backed throughout
+except ImportError:
+    np = None
+
+_BY_TIME = itemgetter("time")  # C-implemented sort key for order dicts
+
+
+# Interpretation buckets: (ascending threshold edges, one message per bucket),
+# selected with a bisect instead of chained if/elif branches. Edges follow the
+# original comparisons — strict greater-than uses bisect_left, strict
+# less-than uses bisect_right — so every boundary value keeps its old message.
+_RETURN_BUCKETS = (
+    (0.0, 0.1),
+    ("The strategy shows **negative performance** with losses over the backtest period. ",
+     "The strategy shows **modest positive performance** with small but positive returns. ",
+     "The strategy demonstrates **strong positive performance** with significant returns. "),
+)
+_SHARPE_BUCKETS = (
+    (0.5, 1.0),
+    ("The **Sharpe ratio is poor**, suggesting weak risk-adjusted returns. ",
+     "The **Sharpe ratio is good**, showing decent risk-adjusted performance. ",
+     "The **Sharpe ratio is excellent**, indicating strong risk-adjusted returns. "),
+)
+_DRAWDOWN_BUCKETS = (
+    (0.1, 0.2),
+    ("**Maximum drawdown is low**, indicating good risk management. ",
+     "**Maximum drawdown is moderate**, showing acceptable risk levels. ",
+     "**Maximum drawdown is high**, indicating significant risk exposure. "),
+)
+_WIN_RATE_BUCKETS = (
+    (0.4, 0.6),
+    ("The **win rate is low**, indicating poor trade selection. ",
+     "The **win rate is moderate**, showing mixed trade quality. ",
+     "The **win rate is high**, suggesting good trade selection. "),
+)
+_PROFIT_FACTOR_BUCKETS = (
+    (1.0, 1.5, 2.0),
+    ("**Profit factor is poor** (<1.0), suggesting losses exceed gains. ",
+     "**Profit factor is positive** (>1.0), indicating net profitability. ",
+     "**Profit factor is good** (>1.5), showing profitable trade distribution. ",
+     "**Profit factor is excellent** (>2.0), indicating that winning trades significantly outweigh losing trades. "),
+)
+_TRADE_COUNT_BUCKETS = (
+    (10, 101),
+    ("**Low trade frequency** may limit statistical significance of results. ",
+     "",
+     "**High trade frequency** provides good statistical sample size. "),
+)
+
+
+def _bucket(table, value, right=False):
+    edges, messages = table
+    return messages[bisect_right(edges, value) if right else bisect_left(edges, value)]
+
+
+# One compiled row template shared by every label/value markdown table
+_TABLE_ROW = "| **{label}** | {value} |\n"
+
+
+def _portfolio_series_kernel(is_buy, sym_ids, qtys, prices, n_symbols, initial_capital):
+    """Single-pass equity accumulator over typed order columns.
+
+    Written against plain numpy arrays and scalar control flow so numba
+    can jit it unchanged when installed (see the import guard below);
+    otherwise it runs as-is in CPython.
+    """
+    n = len(qtys)
+    pv = np.empty(n + 1, dtype=np.float64)
+    pv[0] = initial_capital
+    cash = initial_capital
+    qty = np.zeros(n_symbols, dtype=np.int64)
+    avg_price = np.zeros(n_symbols, dtype=np.float64)
+    position_value = 0.0
+    for k in range(n):
+        sid = sym_ids[k]
+        q = qtys[k]
+        px = prices[k]
+        old_contrib = qty[sid] * avg_price[sid]
+        if is_buy[k]:
+            new_qty = qty[sid] + q
+            if new_qty > 0:
+                avg_price[sid] = (avg_price[sid] * qty[sid] + px * q) / new_qty
+            qty[sid] = new_qty
+            cash -= q * px
+        else:
+            sell_qty = min(q, qty[sid])
+            qty[sid] -= sell_qty
+            if qty[sid] == 0:
+                avg_price[sid] = 0.0
+            cash += sell_qty * px
+        position_value += qty[sid] * avg_price[sid] - old_contrib
+        pv[k + 1] = cash + position_value
+    return pv
+
+
+def _trade_pnl_kernel(is_buy, qtys, prices):
+    """Round-trip P&L state machine over one symbol's typed order columns.
+
+    Same position/avg-price matching as the old per-order Python loop in
+    _calculate_trade_statistics, with scalar control flow only so numba
+    can jit it unchanged when installed.
+    """
+    n = len(qtys)
+    out = np.empty(n, dtype=np.float64)
+    m = 0
+    position = 0
+    avg_price = 0.0
+    for k in range(n):
+        q = qtys[k]
+        px = prices[k]
+        if is_buy[k]:
+            if position >= 0:  # adding to long position
+                new_position = position + q
+                if new_position > 0:
+                    avg_price = (avg_price * position + px * q) / new_position
+                position = new_position
+            else:  # covering short position
+                cover_qty = min(q, -position)
+                out[m] = cover_qty * (avg_price - px)
+                m += 1
+                position += cover_qty
+                if position == 0:
+                    avg_price = 0.0
+        else:
+            if position <= 0:  # adding to short position
+                new_position = position - q
+                if new_position < 0:
+                    avg_price = (avg_price * (-position) + px * q) / (-new_position)
+                position = new_position
+            else:  # closing long position
+                close_qty = min(q, position)
+                out[m] = close_qty * (px - avg_price)
+                m += 1
+                position -= close_qty
+                if position == 0:
+                    avg_price = 0.0
+    return out[:m]
+
+
+try:  # optional: compile the accumulators when numba is available
+    from numba import njit
+    _portfolio_series_kernel = njit(cache=True)(_portfolio_series_kernel)
+    _trade_pnl_kernel = njit(cache=True)(_trade_pnl_kernel)
+except ImportError:
+    pass
+
 @dataclass
 class PerformanceMetrics:
     """Container for performance metrics"""
@@ -35,23 +185,39 @@ class PerformanceMetrics:
 
 class PerformanceReporter:
     """Computes and reports trading strategy performance metrics"""
-    
+
+    # Default report path, resolved once at import instead of per call
+    _DEFAULT_OUT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "performance.md")
+
+
     def __init__(self, initial_capital: float = 10000.0, risk_free_rate: float = 0.02):
+        if np is None:
+            raise RuntimeError("performance reporting requires numpy")
         self.initial_capital = initial_capital
         self.risk_free_rate = risk_free_rate
         self.trading_days_per_year = 252
+        # Last computed (orders identity, portfolio_values, returns) — lets
+        # generate_performance_report reuse the series calculate_performance
+        # already built instead of re-sorting and re-accumulating the orders
+        self._last_series: Optional[Tuple[int, np.ndarray, np.ndarray]] = None
         
-    def calculate_performance(self, backtest_report: Dict) -> PerformanceMetrics:
-        """Calculate comprehensive performance metrics from backtest results"""
+    def calculate_performance(self, backtest_report: Dict, assume_sorted: bool = False) -> PerformanceMetrics:
+        """Calculate comprehensive performance metrics from backtest results.
+
+        assume_sorted=True skips the per-helper time sorts when the caller
+        guarantees orders are already chronological (the engine's report
+        logs them in execution order).
+        """
 
         positions = backtest_report.get("positions", {})
         orders = backtest_report.get("orders", [])
         errors = backtest_report.get("errors", [])
         
-        # Calculate portfolio value over time
-        portfolio_values, returns = self._calculate_portfolio_series(orders, positions)
-        
-        if not portfolio_values:
+        # Calculate portfolio value over time (cached for the report pass)
+        portfolio_values, returns = self._calculate_portfolio_series(orders, positions, assume_sorted)
+        self._last_series = (id(orders), portfolio_values, returns)
+
+        if len(portfolio_values) == 0:
             return self._empty_metrics()
         
         # Calculate basic metrics
@@ -62,8 +228,8 @@ class PerformanceReporter:
         years = days / self.trading_days_per_year
         annualized_return = (portfolio_values[-1] / self.initial_capital) ** (1 / years) - 1 if years > 0 else 0
         
-        # Calculate volatility (annualized)
-        volatility = statistics.stdev(returns) * math.sqrt(self.trading_days_per_year) if len(returns) > 1 else 0
+        # Calculate volatility (annualized); sample std (ddof=1) as before
+        volatility = float(returns.std(ddof=1)) * math.sqrt(self.trading_days_per_year) if len(returns) > 1 else 0
         
         # Calculate Sharpe ratio
         excess_return = annualized_return - self.risk_free_rate
@@ -73,7 +239,7 @@ class PerformanceReporter:
         max_dd, max_dd_duration = self._calculate_max_drawdown(portfolio_values)
         
         # Calculate trade statistics
-        trade_stats = self._calculate_trade_statistics(orders)
+        trade_stats = self._calculate_trade_statistics(orders, assume_sorted)
         
         return PerformanceMetrics(
             total_return=total_return,
@@ -93,89 +259,79 @@ class PerformanceReporter:
             largest_loss=trade_stats["largest_loss"]
         )
     
-    def _calculate_portfolio_series(self, orders: List[Dict], final_positions: Dict) -> Tuple[List[float], List[float]]:
-        """Calculate portfolio value series and returns from orders"""
+    def _calculate_portfolio_series(self, orders: List[Dict], final_positions: Dict,
+                                    assume_sorted: bool = False) -> Tuple[np.ndarray, np.ndarray]:
+        """Calculate portfolio value series and returns from orders.
+
+        Single pass over the filled orders: position arrays are indexed by
+        symbol id and the aggregate position value is maintained
+        incrementally (only the traded symbol's contribution changes per
+        order), so each step is O(1) instead of a re-sum over all symbols.
+        Returns are computed vectorized at the end.
+        """
         if not orders:
-            return [], []
-        
-        # Sort orders by timestamp
-        sorted_orders = sorted(orders, key=lambda x: x["time"])
-        
-        # Track portfolio value over time
-        portfolio_values = [self.initial_capital]
-        current_cash = self.initial_capital
-        positions = {}
-        
-        for order in sorted_orders:
-            if order["status"] != "FILLED":
-                continue
-                
+            return np.empty(0), np.empty(0)
+
+        # Sort orders by timestamp (unless already chronological), keep only fills
+        sorted_orders = orders if assume_sorted else sorted(orders, key=_BY_TIME)
+        filled = [o for o in sorted_orders if o["status"] == "FILLED"]
+
+        # Extract typed columns once, then run the accumulator kernel
+        n = len(filled)
+        is_buy = np.empty(n, dtype=np.bool_)
+        sym_ids = np.empty(n, dtype=np.int64)
+        qtys = np.empty(n, dtype=np.int64)
+        prices = np.empty(n, dtype=np.float64)
+        sym_idx: Dict[str, int] = {}
+        for k, order in enumerate(filled):
             symbol = order["symbol"]
-            side = order["side"]
-            quantity = order["qty"]
-            price = order["price"]
-            
-            # Initialize position if needed
-            if symbol not in positions:
-                positions[symbol] = {"quantity": 0, "avg_price": 0.0}
-            
-            pos = positions[symbol]
-            
-            if side == "BUY":
-                # Update position
-                old_qty = pos["quantity"]
-                new_qty = old_qty + quantity
-                if new_qty > 0:
-                    pos["avg_price"] = (pos["avg_price"] * old_qty + price * quantity) / new_qty
-                pos["quantity"] = new_qty
-                current_cash -= quantity * price
-            elif side == "SELL":
-                # Update position
-                sell_qty = min(quantity, pos["quantity"])
-                pos["quantity"] -= sell_qty
-                if pos["quantity"] == 0:
-                    pos["avg_price"] = 0.0
-                current_cash += sell_qty * price
-            
-            # Calculate current portfolio value
-            portfolio_value = current_cash
-            for sym, pos_data in positions.items():
-                portfolio_value += pos_data["quantity"] * pos_data["avg_price"]
-            
-            portfolio_values.append(portfolio_value)
-        
-        # Calculate returns
-        returns = []
-        for i in range(1, len(portfolio_values)):
-            if portfolio_values[i-1] != 0:
-                ret = (portfolio_values[i] - portfolio_values[i-1]) / portfolio_values[i-1]
-                returns.append(ret)
-        
+            sid = sym_idx.get(symbol)
+            if sid is None:
+                sid = sym_idx.setdefault(symbol, len(sym_idx))
+            is_buy[k] = order["side"] == "BUY"
+            sym_ids[k] = sid
+            qtys[k] = order["qty"]
+            prices[k] = order["price"]
+
+        portfolio_values = _portfolio_series_kernel(
+            is_buy, sym_ids, qtys, prices, max(len(sym_idx), 1), self.initial_capital)
+
+        # Vectorized returns; entries after a zero value are dropped, as before
+        prev = portfolio_values[:-1]
+        nonzero = prev != 0
+        returns = (np.diff(portfolio_values) / np.where(nonzero, prev, 1.0))[nonzero]
+
         return portfolio_values, returns
     
     def _calculate_max_drawdown(self, portfolio_values: List[float]) -> Tuple[float, int]:
-        """Calculate maximum drawdown and its duration"""
-        if not portfolio_values:
+        """Calculate maximum drawdown and its duration.
+
+        Vectorized: running peak via np.maximum.accumulate, drawdown as
+        (peak - value) / peak, and the duration as the longest run of
+        ticks that did not set a new peak — same semantics as the old
+        per-value loop, in O(N) C passes.
+        """
+        pv = np.asarray(portfolio_values, dtype=np.float64)
+        if len(pv) == 0:
             return 0.0, 0
-        
-        peak = portfolio_values[0]
-        max_dd = 0.0
-        max_dd_duration = 0
-        current_dd_duration = 0
-        
-        for value in portfolio_values:
-            if value > peak:
-                peak = value
-                current_dd_duration = 0
-            else:
-                dd = (peak - value) / peak
-                max_dd = max(max_dd, dd)
-                current_dd_duration += 1
-                max_dd_duration = max(max_dd_duration, current_dd_duration)
-        
+
+        running_max = np.maximum.accumulate(pv)
+        dd = np.divide(running_max - pv, running_max,
+                       out=np.zeros_like(pv), where=running_max > 0)
+        max_dd = float(dd.max())
+
+        # Longest run of consecutive non-new-peak values (the first value
+        # never counts as a new peak, matching the old loop)
+        under_water = np.concatenate(([True], pv[1:] <= running_max[:-1]))
+        bounds = np.flatnonzero(np.concatenate(
+            ([True], under_water[1:] != under_water[:-1], [True])))
+        run_lengths = np.diff(bounds)
+        run_is_under = under_water[bounds[:-1]]
+        max_dd_duration = int(run_lengths[run_is_under].max()) if run_is_under.any() else 0
+
         return max_dd, max_dd_duration
     
-    def _calculate_trade_statistics(self, orders: List[Dict]) -> Dict:
+    def _calculate_trade_statistics(self, orders: List[Dict], assume_sorted: bool = False) -> Dict:
         """Calculate trade-level statistics"""
         filled_orders = [o for o in orders if o["status"] == "FILLED"]
         
@@ -200,59 +356,40 @@ class PerformanceReporter:
                 symbol_orders[symbol] = []
             symbol_orders[symbol].append(order)
         
-        trade_pnls = []
+        # Each symbol's round-trip P&L comes from the typed state-machine
+        # kernel; Python only extracts the (is_buy, qty, price) columns
+        pnl_chunks = []
         for symbol, symbol_order_list in symbol_orders.items():
-            symbol_order_list.sort(key=lambda x: x["time"])
-            
-            # Calculate P&L for each round trip
-            position = 0
-            avg_price = 0.0
-            
-            for order in symbol_order_list:
-                if order["side"] == "BUY":
-                    if position >= 0:  # Adding to long position
-                        new_position = position + order["qty"]
-                        if new_position > 0:
-                            avg_price = (avg_price * position + order["price"] * order["qty"]) / new_position
-                        position = new_position
-                    else:  # Covering short position
-                        cover_qty = min(order["qty"], abs(position))
-                        pnl = cover_qty * (avg_price - order["price"])
-                        trade_pnls.append(pnl)
-                        position += cover_qty
-                        if position == 0:
-                            avg_price = 0.0
-                
-                elif order["side"] == "SELL":
-                    if position <= 0:  # Adding to short position
-                        new_position = position - order["qty"]
-                        if new_position < 0:
-                            avg_price = (avg_price * abs(position) + order["price"] * order["qty"]) / abs(new_position)
-                        position = new_position
-                    else:  # Closing long position
-                        close_qty = min(order["qty"], position)
-                        pnl = close_qty * (order["price"] - avg_price)
-                        trade_pnls.append(pnl)
-                        position -= close_qty
-                        if position == 0:
-                            avg_price = 0.0
-        
-        # Calculate statistics
-        winning_trades = [pnl for pnl in trade_pnls if pnl > 0]
-        losing_trades = [pnl for pnl in trade_pnls if pnl < 0]
-        
-        total_trades = len(trade_pnls)
-        winning_count = len(winning_trades)
-        losing_count = len(losing_trades)
-        
+            if not assume_sorted:  # grouping preserves chronological input order
+                symbol_order_list.sort(key=_BY_TIME)
+            k = len(symbol_order_list)
+            is_buy = np.empty(k, dtype=np.bool_)
+            qtys = np.empty(k, dtype=np.int64)
+            prices = np.empty(k, dtype=np.float64)
+            for i, order in enumerate(symbol_order_list):
+                is_buy[i] = order["side"] == "BUY"
+                qtys[i] = order["qty"]
+                prices[i] = order["price"]
+            pnl_chunks.append(_trade_pnl_kernel(is_buy, qtys, prices))
+
+        # Calculate statistics: boolean masks plus C-level reductions over
+        # one float64 array instead of Python list comprehensions per stat
+        pnl = np.concatenate(pnl_chunks) if pnl_chunks else np.empty(0)
+        wins = pnl[pnl > 0]
+        losses = pnl[pnl < 0]
+
+        total_trades = len(pnl)
+        winning_count = len(wins)
+        losing_count = len(losses)
+
         win_rate = winning_count / total_trades if total_trades > 0 else 0.0
-        avg_win = statistics.mean(winning_trades) if winning_trades else 0.0
-        avg_loss = statistics.mean(losing_trades) if losing_trades else 0.0
-        largest_win = max(winning_trades) if winning_trades else 0.0
-        largest_loss = min(losing_trades) if losing_trades else 0.0
-        
-        gross_profit = sum(winning_trades)
-        gross_loss = abs(sum(losing_trades))
+        avg_win = float(wins.mean()) if winning_count else 0.0
+        avg_loss = float(losses.mean()) if losing_count else 0.0
+        largest_win = float(wins.max()) if winning_count else 0.0
+        largest_loss = float(losses.min()) if losing_count else 0.0
+
+        gross_profit = float(wins.sum())
+        gross_loss = -float(losses.sum())
         profit_factor = gross_profit / gross_loss if gross_loss > 0 else float('inf') if gross_profit > 0 else 0.0
         
         return {
@@ -288,249 +425,249 @@ class PerformanceReporter:
         )
     
     def generate_equity_curve_ascii(self, portfolio_values: List[float], width: int = 80, height: int = 20) -> str:
-        """Generate ASCII art equity curve"""
-        if not portfolio_values:
+        """Generate ASCII art equity curve.
+
+        Rasterized with numpy: point coordinates are computed for the whole
+        series at once, and the connecting segments are expanded into one
+        flat array of (x, y) cells scattered into a uint8 grid — no
+        per-pixel Python loop. Same interpolation (truncated linear, step
+        count max(|dx|, |dy|)) and same output as the old nested loops.
+        """
+        if len(portfolio_values) == 0:
             return "No data available for equity curve"
-        
-        min_val = min(portfolio_values)
-        max_val = max(portfolio_values)
+
+        pv = np.asarray(portfolio_values, dtype=np.float64)
+        n = len(pv)
+        min_val = float(pv.min())
+        max_val = float(pv.max())
         val_range = max_val - min_val
-        
+
         if val_range == 0:
             return "No variation in portfolio value"
-        
-        # Create ASCII grid
-        grid = [[' ' for _ in range(width)] for _ in range(height)]
-        
-        # Plot points
-        for i, value in enumerate(portfolio_values):
-            x = int((i / (len(portfolio_values) - 1)) * (width - 1)) if len(portfolio_values) > 1 else width // 2
-            y = int(((value - min_val) / val_range) * (height - 1))
-            if 0 <= x < width and 0 <= y < height:
-                grid[height - 1 - y][x] = '*'
-        
-        # Connect points with lines
-        for i in range(len(portfolio_values) - 1):
-            x1 = int((i / (len(portfolio_values) - 1)) * (width - 1)) if len(portfolio_values) > 1 else width // 2
-            x2 = int(((i + 1) / (len(portfolio_values) - 1)) * (width - 1)) if len(portfolio_values) > 1 else width // 2
-            y1 = int(((portfolio_values[i] - min_val) / val_range) * (height - 1))
-            y2 = int(((portfolio_values[i + 1] - min_val) / val_range) * (height - 1))
-            
-            # Simple line drawing
-            steps = max(abs(x2 - x1), abs(y2 - y1))
-            if steps > 0:
-                for step in range(steps + 1):
-                    x = x1 + (x2 - x1) * step // steps
-                    y = y1 + (y2 - y1) * step // steps
-                    if 0 <= x < width and 0 <= y < height:
-                        grid[height - 1 - y][x] = '*'
-        
+
+        # All integer coordinates in two vectorized expressions
+        if n > 1:
+            x = ((np.arange(n) / (n - 1)) * (width - 1)).astype(np.int64)
+        else:
+            x = np.full(n, width // 2, dtype=np.int64)
+        y = (((pv - min_val) / val_range) * (height - 1)).astype(np.int64)
+
+        # Create ASCII grid and scatter the data points
+        grid = np.full((height, width), ord(' '), dtype=np.uint8)
+        grid[height - 1 - y, x] = ord('*')
+
+        # Connect points with lines: expand every segment into its
+        # interpolated cells (step s of steps -> p1 + (p2 - p1) * s // steps)
+        dx = np.diff(x)
+        dy = np.diff(y)
+        steps = np.maximum(np.abs(dx), np.abs(dy))
+        active = np.flatnonzero(steps > 0)
+        if len(active):
+            counts = steps[active] + 1
+            seg = np.repeat(active, counts)           # owning segment per cell
+            offsets = np.concatenate(([0], np.cumsum(counts)[:-1]))
+            s = np.arange(counts.sum()) - np.repeat(offsets, counts)
+            xs = x[seg] + dx[seg] * s // steps[seg]
+            ys = y[seg] + dy[seg] * s // steps[seg]
+            grid[height - 1 - ys, xs] = ord('*')
+
         # Add axes
-        for i in range(height):
-            grid[i][0] = '|'
-        for i in range(width):
-            grid[height - 1][i] = '-'
-        
-        # Convert to string
-        lines = [''.join(row) for row in grid]
-        
-        # labels
-        result = f"Equity Curve (${min_val:.2f} - ${max_val:.2f})\n"
-        result += '\n'.join(lines)
-        result += f"\nInitial: ${self.initial_capital:.2f} | Final: ${portfolio_values[-1]:.2f}"
-        
-        return result
+        grid[:, 0] = ord('|')
+        grid[height - 1, :] = ord('-')
+
+        # Convert to string, with labels, in one join
+        lines = [bytes(row).decode('ascii') for row in grid]
+        return '\n'.join([
+            f"Equity Curve (${min_val:.2f} - ${max_val:.2f})",
+            *lines,
+            f"Initial: ${self.initial_capital:.2f} | Final: ${pv[-1]:.2f}",
+        ])
     
-    def generate_performance_report(self, backtest_report: Dict, output_file: str = None) -> str:
+    def generate_performance_report(self, backtest_report: Dict, output_file: str = None,
+                                    write_to_disk: bool = True,
+                                    report_time: Optional[datetime] = None,
+                                    assume_sorted: bool = False) -> str:
         """
         Generate comprehensive performance report in Markdown format
-            
+
+        Sweeps generating many reports can pass write_to_disk=False to get
+        the string back without touching the filesystem, and a fixed
+        report_time for reproducible headers.
+
         Returns:
             Markdown report content as string
         """
         # Calculate performance metrics
-        metrics = self.calculate_performance(backtest_report)
+        metrics = self.calculate_performance(backtest_report, assume_sorted)
         
         orders = backtest_report.get("orders", [])
         errors = backtest_report.get("errors", [])
         positions = backtest_report.get("positions", {})
         
-        # Calculate portfolio series for equity curve
-        portfolio_values, returns = self._calculate_portfolio_series(orders, positions)
+        # Reuse the series calculate_performance just computed for these
+        # orders; only recompute if called with a different report
+        if self._last_series is not None and self._last_series[0] == id(orders):
+            _, portfolio_values, returns = self._last_series
+        else:
+            portfolio_values, returns = self._calculate_portfolio_series(orders, positions, assume_sorted)
         
         # Generate report content
-        report_content = self._generate_markdown_content(metrics, orders, errors, positions, portfolio_values, returns)
+        report_content = self._generate_markdown_content(metrics, orders, errors, positions, portfolio_values, returns,
+                                                        report_time=report_time)
         
+        if not write_to_disk:
+            return report_content
+
         if output_file is None:
-            import os
-            current_dir = os.path.dirname(os.path.abspath(__file__))
-            output_file = os.path.join(current_dir, "performance.md")
-        
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.write(report_content)
-        
+            output_file = self._DEFAULT_OUT
+
+        # One encode + one raw write: skips the TextIOWrapper encoder layer
+        fd = os.open(output_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            os.write(fd, report_content.encode('utf-8'))
+        finally:
+            os.close(fd)
+
         return report_content
     
     def _generate_markdown_content(self, metrics: PerformanceMetrics, orders: List[Dict], 
                                  errors: List[str], positions: Dict, portfolio_values: List[float], 
-                                 returns: List[float]) -> str:
-        """Generate the markdown report content"""
-        
+                                 returns: List[float], report_time: Optional[datetime] = None) -> str:
+        """Generate the markdown report content.
+
+        Built as a list of parts joined once at the end; repeated `+=` on
+        one big string re-copies the whole report on every append.
+        """
+        parts: List[str] = []
+        add = parts.append
+
         # Header
-        content = "# Performance Report\n\n"
-        content += f"**Generated on:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
-        content += "---\n\n"
-        
+        add("# Performance Report\n\n")
+        add(f"**Generated on:** {(report_time or datetime.now()).strftime('%Y-%m-%d %H:%M:%S')}\n\n")
+        add("---\n\n")
+
         # Executive Summary
-        content += "## Executive Summary\n\n"
-        content += f"This report analyzes the performance of algorithmic trading strategies "
-        content += f"over the backtest period. The strategies generated {metrics.total_trades} total trades "
-        content += f"with a final portfolio value of ${portfolio_values[-1]:.2f} "
-        content += f"(starting from ${self.initial_capital:.2f}).\n\n"
-        
-        # Key Performance Metrics Table
-        content += "## Key Performance Metrics\n\n"
-        content += "| Metric | Value |\n"
-        content += "|--------|-------|\n"
-        content += f"| **Total Return** | {metrics.total_return:.2%} |\n"
-        content += f"| **Annualized Return** | {metrics.annualized_return:.2%} |\n"
-        content += f"| **Sharpe Ratio** | {metrics.sharpe_ratio:.3f} |\n"
-        content += f"| **Maximum Drawdown** | {metrics.max_drawdown:.2%} |\n"
-        content += f"| **Volatility (Annualized)** | {metrics.volatility:.2%} |\n"
-        content += f"| **Win Rate** | {metrics.win_rate:.2%} |\n"
-        content += f"| **Profit Factor** | {metrics.profit_factor:.2f} |\n"
-        content += f"| **Total Trades** | {metrics.total_trades} |\n\n"
-        
-        # Trade Statistics
-        content += "## Trade Statistics\n\n"
-        content += "| Statistic | Value |\n"
-        content += "|-----------|-------|\n"
-        content += f"| **Winning Trades** | {metrics.winning_trades} |\n"
-        content += f"| **Losing Trades** | {metrics.losing_trades} |\n"
-        content += f"| **Average Win** | ${metrics.avg_win:.2f} |\n"
-        content += f"| **Average Loss** | ${metrics.avg_loss:.2f} |\n"
-        content += f"| **Largest Win** | ${metrics.largest_win:.2f} |\n"
-        content += f"| **Largest Loss** | ${metrics.largest_loss:.2f} |\n\n"
-        
-        # Risk Metrics
-        content += "## Risk Analysis\n\n"
-        content += "| Risk Metric | Value |\n"
-        content += "|-------------|-------|\n"
-        content += f"| **Maximum Drawdown** | {metrics.max_drawdown:.2%} |\n"
-        content += f"| **Max DD Duration** | {metrics.max_drawdown_duration} periods |\n"
-        content += f"| **Volatility** | {metrics.volatility:.2%} |\n"
-        content += f"| **Sharpe Ratio** | {metrics.sharpe_ratio:.3f} |\n\n"
-        
+        add(f"""## Executive Summary
+
+This report analyzes the performance of algorithmic trading strategies \
+over the backtest period. The strategies generated {metrics.total_trades} total trades \
+with a final portfolio value of ${portfolio_values[-1]:.2f} \
+(starting from ${self.initial_capital:.2f}).
+
+""")
+
+        # The three label/value tables all render through the shared
+        # compiled row template instead of a parsed f-string per row
+        add("## Key Performance Metrics\n\n| Metric | Value |\n|--------|-------|\n")
+        add("".join(_TABLE_ROW.format_map(row) for row in (
+            {"label": "Total Return", "value": f"{metrics.total_return:.2%}"},
+            {"label": "Annualized Return", "value": f"{metrics.annualized_return:.2%}"},
+            {"label": "Sharpe Ratio", "value": f"{metrics.sharpe_ratio:.3f}"},
+            {"label": "Maximum Drawdown", "value": f"{metrics.max_drawdown:.2%}"},
+            {"label": "Volatility (Annualized)", "value": f"{metrics.volatility:.2%}"},
+            {"label": "Win Rate", "value": f"{metrics.win_rate:.2%}"},
+            {"label": "Profit Factor", "value": f"{metrics.profit_factor:.2f}"},
+            {"label": "Total Trades", "value": metrics.total_trades},
+        )))
+
+        add("\n## Trade Statistics\n\n| Statistic | Value |\n|-----------|-------|\n")
+        add("".join(_TABLE_ROW.format_map(row) for row in (
+            {"label": "Winning Trades", "value": metrics.winning_trades},
+            {"label": "Losing Trades", "value": metrics.losing_trades},
+            {"label": "Average Win", "value": f"${metrics.avg_win:.2f}"},
+            {"label": "Average Loss", "value": f"${metrics.avg_loss:.2f}"},
+            {"label": "Largest Win", "value": f"${metrics.largest_win:.2f}"},
+            {"label": "Largest Loss", "value": f"${metrics.largest_loss:.2f}"},
+        )))
+
+        add("\n## Risk Analysis\n\n| Risk Metric | Value |\n|-------------|-------|\n")
+        add("".join(_TABLE_ROW.format_map(row) for row in (
+            {"label": "Maximum Drawdown", "value": f"{metrics.max_drawdown:.2%}"},
+            {"label": "Max DD Duration", "value": f"{metrics.max_drawdown_duration} periods"},
+            {"label": "Volatility", "value": f"{metrics.volatility:.2%}"},
+            {"label": "Sharpe Ratio", "value": f"{metrics.sharpe_ratio:.3f}"},
+        )))
+        add("\n")
+
         # Equity Curve
-        content += "## Equity Curve\n\n"
-        if portfolio_values:
-            content += "```\n"
-            content += self.generate_equity_curve_ascii(portfolio_values)
-            content += "\n```\n\n"
+        add("## Equity Curve\n\n")
+        if len(portfolio_values):
+            add("```\n")
+            add(self.generate_equity_curve_ascii(portfolio_values))
+            add("\n```\n\n")
         else:
-            content += "No portfolio data available for equity curve.\n\n"
-        
+            add("No portfolio data available for equity curve.\n\n")
+
         # Returns Analysis
-        if returns:
-            content += "## Returns Analysis\n\n"
-            content += f"**Periodic Returns Statistics:**\n\n"
-            content += f"- **Mean Return:** {statistics.mean(returns):.4%}\n"
-            content += f"- **Median Return:** {statistics.median(returns):.4%}\n"
-            content += f"- **Standard Deviation:** {statistics.stdev(returns):.4%}\n"
-            content += f"- **Min Return:** {min(returns):.4%}\n"
-            content += f"- **Max Return:** {max(returns):.4%}\n\n"
-        
+        if len(returns):
+            returns = np.asarray(returns, dtype=np.float64)
+            add(f"""## Returns Analysis
+
+**Periodic Returns Statistics:**
+
+- **Mean Return:** {returns.mean():.4%}
+- **Median Return:** {np.median(returns):.4%}
+- **Standard Deviation:** {returns.std(ddof=1):.4%}
+- **Min Return:** {returns.min():.4%}
+- **Max Return:** {returns.max():.4%}
+
+""")
+
         # Final Positions
-        content += "## Final Positions\n\n"
+        add("## Final Positions\n\n")
         if positions:
-            content += "| Symbol | Quantity | Average Price | Market Value |\n"
-            content += "|--------|----------|---------------|-------------|\n"
-            for symbol, pos_data in positions.items():
+            add("| Symbol | Quantity | Average Price | Market Value |\n")
+            add("|--------|----------|---------------|-------------|\n")
+            # Dense qty/price arrays so the market-value column (and any
+            # aggregate via np.vdot) comes from one C multiply, not a
+            # per-symbol Python product
+            symbols = list(positions)
+            qty_arr = np.array([positions[s].get("quantity", 0) for s in symbols], dtype=np.float64)
+            px_arr = np.array([positions[s].get("avg_price", 0.0) for s in symbols], dtype=np.float64)
+            mv_arr = qty_arr * px_arr
+            for symbol, mv in zip(symbols, mv_arr):
+                pos_data = positions[symbol]
                 qty = pos_data.get("quantity", 0)
                 avg_price = pos_data.get("avg_price", 0.0)
-                market_value = qty * avg_price
-                content += f"| {symbol} | {qty} | ${avg_price:.2f} | ${market_value:.2f} |\n"
+                add(f"| {symbol} | {qty} | ${avg_price:.2f} | ${mv:.2f} |\n")
         else:
-            content += "No positions held at end of backtest.\n"
-        content += "\n"
-        
+            add("No positions held at end of backtest.\n")
+        add("\n")
+
         # Error Analysis
         if errors:
-            content += "## Error Analysis\n\n"
-            content += f"**Total Errors:** {len(errors)}\n\n"
-            content += "**Error Summary:**\n"
-            error_types = {}
-            for error in errors:
-                error_type = error.split(":")[0] if ":" in error else "Unknown"
-                error_types[error_type] = error_types.get(error_type, 0) + 1
-            
+            add("## Error Analysis\n\n")
+            add(f"**Total Errors:** {len(errors)}\n\n")
+            add("**Error Summary:**\n")
+            # C-level counting; maxsplit=1 stops scanning at the first colon
+            error_types = Counter(
+                e.split(":", 1)[0] if ":" in e else "Unknown" for e in errors)
+
             for error_type, count in error_types.items():
-                content += f"- {error_type}: {count}\n"
-            content += "\n"
-        
+                add(f"- {error_type}: {count}\n")
+            add("\n")
+
         # Performance Interpretation
-        content += "## Performance Interpretation\n\n"
-        content += self._generate_performance_interpretation(metrics)
-        
+        add("## Performance Interpretation\n\n")
+        add(self._generate_performance_interpretation(metrics))
+
         # Recommendations
-        content += "## Recommendations\n\n"
-        content += self._generate_recommendations(metrics, len(errors))
-        
-        return content
+        add("## Recommendations\n\n")
+        add(self._generate_recommendations(metrics, len(errors)))
+
+        return "".join(parts)
     
     def _generate_performance_interpretation(self, metrics: PerformanceMetrics) -> str:
         """Generate narrative interpretation of performance results"""
-        interpretation = ""
-        
-        # Overall performance assessment
-        if metrics.total_return > 0.1:
-            interpretation += "The strategy demonstrates **strong positive performance** with significant returns. "
-        elif metrics.total_return > 0:
-            interpretation += "The strategy shows **modest positive performance** with small but positive returns. "
-        else:
-            interpretation += "The strategy shows **negative performance** with losses over the backtest period. "
-        
-        # Risk assessment
-        if metrics.sharpe_ratio > 1.0:
-            interpretation += "The **Sharpe ratio is excellent**, indicating strong risk-adjusted returns. "
-        elif metrics.sharpe_ratio > 0.5:
-            interpretation += "The **Sharpe ratio is good**, showing decent risk-adjusted performance. "
-        else:
-            interpretation += "The **Sharpe ratio is poor**, suggesting weak risk-adjusted returns. "
-        
-        # Drawdown assessment
-        if metrics.max_drawdown < 0.1:
-            interpretation += "**Maximum drawdown is low**, indicating good risk management. "
-        elif metrics.max_drawdown < 0.2:
-            interpretation += "**Maximum drawdown is moderate**, showing acceptable risk levels. "
-        else:
-            interpretation += "**Maximum drawdown is high**, indicating significant risk exposure. "
-        
-        # Win rate assessment
-        if metrics.win_rate > 0.6:
-            interpretation += "The **win rate is high**, suggesting good trade selection. "
-        elif metrics.win_rate > 0.4:
-            interpretation += "The **win rate is moderate**, showing mixed trade quality. "
-        else:
-            interpretation += "The **win rate is low**, indicating poor trade selection. "
-        
-        interpretation += "\n\n"
-        
-        if metrics.profit_factor > 2.0:
-            interpretation += "**Profit factor is excellent** (>2.0), indicating that winning trades significantly outweigh losing trades. "
-        elif metrics.profit_factor > 1.5:
-            interpretation += "**Profit factor is good** (>1.5), showing profitable trade distribution. "
-        elif metrics.profit_factor > 1.0:
-            interpretation += "**Profit factor is positive** (>1.0), indicating net profitability. "
-        else:
-            interpretation += "**Profit factor is poor** (<1.0), suggesting losses exceed gains. "
-        
-        if metrics.total_trades < 10:
-            interpretation += "**Low trade frequency** may limit statistical significance of results. "
-        elif metrics.total_trades > 100:
-            interpretation += "**High trade frequency** provides good statistical sample size. "
-        
-        return interpretation
+        return "".join((
+            _bucket(_RETURN_BUCKETS, metrics.total_return),
+            _bucket(_SHARPE_BUCKETS, metrics.sharpe_ratio),
+            _bucket(_DRAWDOWN_BUCKETS, metrics.max_drawdown, right=True),
+            _bucket(_WIN_RATE_BUCKETS, metrics.win_rate),
+            "\n\n",
+            _bucket(_PROFIT_FACTOR_BUCKETS, metrics.profit_factor),
+            _bucket(_TRADE_COUNT_BUCKETS, metrics.total_trades, right=True),
+        ))
     
     def _generate_recommendations(self, metrics: PerformanceMetrics, error_count: int) -> str:
         """Generate recommendations based on performance analysis"""
@@ -1,57 +1,358 @@
 
 from __future__ import annotations
-from collections import deque
-from typing import Deque, Dict, List, Tuple, Optional
+import logging
+import types
+from array import array
+from typing import Dict, List, Tuple, Optional, Protocol
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    import kernels  # vectorized batch path; needs numpy
+except ImportError:
+    kernels = None
+
+try:
+    import pandas as pd  # research/batch frames only; not needed live
+except ImportError:
+    pd = None
 
 # Public signal shape: (action, symbol, qty, price)
 Signal = Tuple[str, str, int, float]
 
+log = logging.getLogger(__name__)
+
+
+def _debug_skip_sell(symbol: str, held: int, need: int) -> None:
+    # isEnabledFor guard + %-style args: nothing is formatted unless a
+    # debug handler is actually attached, keeping the skip path free
+    if log.isEnabledFor(logging.DEBUG):
+        log.debug("Skip SELL: only %d shares in %s, need %d", held, symbol, need)
+
+
+def _momentum_decide(now: float, past: float, up: float, dn: float) -> int:
+    """Numeric core of Momentum.generate_signals: +1 BUY / -1 SELL / 0.
+
+    up/dn are the precomputed 1 +/- threshold factors, so the hot path is
+    one multiply and compare per side instead of a divide. Scalar float
+    math only, so numba can jit it unchanged when installed (see the
+    import guard below); plain CPython otherwise.
+    """
+    if past <= 0.0:
+        return 0
+    if now >= past * up:
+        return 1
+    if now <= past * dn:
+        return -1
+    return 0
+
+
+try:  # optional: compile the decision core when numba is available
+    from numba import njit
+    _momentum_decide = njit(cache=True)(_momentum_decide)
+except ImportError:
+    pass
+
+
+# Template for the specialized per-instance MovingAverageCrossover tick
+# handler: symbol, windows and trade qty are baked in as literals, so the
+# hot path carries no attribute loads for them and no symbol-equality
+# indirection. Must stay in lockstep with the generic generate_signals.
+_MA_SIGNALS_TEMPLATE = """\
+def generate_signals(self, tick, positions=None):
+    if tick.symbol != {symbol!r}:
+        return []
+    price = float(tick.price)
+    n = self._n
+    self._n = n + 1
+    sbuf = self._short_buf
+    sh = self._short_head
+    ssum = self._short_sum
+    if n >= {short_w}:
+        ssum -= sbuf[sh]
+    sbuf[sh] = price
+    self._short_head = sh + 1 if sh + 1 < {short_w} else 0
+    ssum += price
+    self._short_sum = ssum
+    lbuf = self._long_buf
+    lh = self._long_head
+    lsum = self._long_sum
+    if n >= {long_w}:
+        lsum -= lbuf[lh]
+    lbuf[lh] = price
+    self._long_head = lh + 1 if lh + 1 < {long_w} else 0
+    lsum += price
+    self._long_sum = lsum
+    if n + 1 < {long_w}:
+        return []
+    diff = ssum * {inv_short!r} - lsum * {inv_long!r}
+    out = []
+    prev = self._prev_diff
+    if prev is not None:
+        action = _SIGNAL_TABLE.get(((prev > 0) - (prev < 0), (diff > 0) - (diff < 0)))
+        if action is not None:
+            if action == "BUY":
+                out.append(("BUY", {symbol!r}, {qty}, price))
+            else:
+                pos = positions.get({symbol!r}) if positions else None
+                held = int(pos["quantity"]) if pos else 0
+                sell_qty = {qty} if {qty} < held else held
+                if sell_qty > 0:
+                    out.append(("SELL", {symbol!r}, sell_qty, price))
+                else:
+                    _debug_skip_sell({symbol!r}, held, {qty})
+    self._prev_diff = diff
+    return out
+"""
+
+class StrategyProto(Protocol):
+    """Structural interface for anything the engine can dispatch to.
+
+    The runtime base below is a plain class on purpose: an ABCMeta base
+    would add metaclass and __instancecheck__ overhead to code that only
+    needs a missing-override error. Static checkers can use this Protocol
+    to accept duck-typed strategies that never subclass Strategy.
+    """
+
+    def generate_signals(self, tick, positions=None) -> List[Signal]: ...
+
+
 class Strategy:
+    __slots__ = ()
+
     def generate_signals(self, tick, positions=None) -> List[Signal]:
         raise NotImplementedError
 
+    def precompute(self, prices):
+        """Batch twin of generate_signals: given this strategy's full price
+        column, return an int8 array (+1 BUY / -1 SELL / 0) per tick, or
+        None when no vectorized kernel is available."""
+        return None
+
+    def generate_signals_batch(self, prices, symbols=None):
+        """Columnar (SoA) dispatch: run this strategy's vectorized kernel
+        over its own rows of the shared price/symbol columns in one call,
+        instead of one generate_signals frame per tick.
+
+        Returns the aligned (sides, prices, indices) event arrays, with
+        indices into the original columns; position gating stays with the
+        caller, as in engine.run_vectorized. None when no kernel or numpy
+        is available, or the strategy has no symbol to select rows by.
+        """
+        if np is None or kernels is None:
+            return None
+        sym = getattr(self, "symbol", None)
+        prices = np.asarray(prices, dtype=np.float64)
+        if symbols is not None:
+            if sym is None:
+                return None
+            rows = np.flatnonzero(np.asarray(symbols) == sym)
+            prices = prices[rows]
+        else:
+            rows = None
+        sig = self.precompute(prices)
+        if sig is None:
+            return None
+        sides, event_px, idx = kernels.signal_events(sig, prices)
+        if rows is not None:
+            idx = rows[idx]
+        return sides, event_px, idx
+
+# Compiled specialized handlers, keyed by (symbol, short, long, qty): a
+# parameter sweep building thousands of identical strategies pays the
+# exec/compile cost once per distinct key, not once per instance
+_SPECIALIZED_CACHE: Dict[tuple, object] = {}
+
+
 class MovingAverageCrossover(Strategy):
+    # Slots cut per-instance memory (parameter sweeps build thousands of
+    # strategies) and make attribute reads fixed-offset loads. The
+    # generate_signals slot holds the specialized handler bound in
+    # __init__; the readable reference lives in generate_signals_generic.
+    __slots__ = ("symbol", "_short_w", "_long_w", "_inv_short", "_inv_long",
+                 "_short_buf", "_long_buf", "_short_head", "_long_head", "_n",
+                 "_short_sum", "_long_sum", "_prev_diff", "_qty",
+                 "generate_signals")
+
+    # Sign-transition lookup for the crossover test: keys are
+    # (sign(prev_diff), sign(diff)) with sign in {-1, 0, +1}. BUY on any
+    # <=0 -> >0 transition, SELL on any >=0 -> <0 transition — the same
+    # pairs the old two-branch cascade accepted.
+    _SIGNAL_TABLE = {
+        (-1, 1): "BUY", (0, 1): "BUY",
+        (1, -1): "SELL", (0, -1): "SELL",
+    }
+
     def __init__(self, symbol: str, short_window: int = 5, long_window: int = 20, trade_qty: int = 1) -> None:
         if not (1 <= short_window < long_window):
             raise ValueError("Require 1 <= short_window < long_window")
         self.symbol = symbol
         self._short_w = short_window
         self._long_w = long_window
-        self._prices: Deque[float] = deque(maxlen=long_window)
+        # Reciprocals precomputed once, so the per-tick diff is two
+        # multiplies instead of two divides
+        self._inv_short = 1.0 / short_window
+        self._inv_long = 1.0 / long_window
+        # One preallocated ring buffer per window (contiguous doubles, as
+        # models.py uses for positions) plus a running sum for each: the
+        # head slot holds the departing price, which is subtracted before
+        # the arriving one overwrites it, so each MA is O(1) per tick with
+        # no linked-node traversal or reallocation
+        self._short_buf = array("d", [0.0] * short_window)
+        self._long_buf = array("d", [0.0] * long_window)
+        self._short_head = 0
+        self._long_head = 0
+        self._n = 0  # ticks seen for this symbol
+        self._short_sum = 0.0
+        self._long_sum = 0.0
         self._prev_diff: Optional[float] = None
         self._qty = trade_qty
+        # Bind a specialized tick handler with the constants inlined; the
+        # generic generate_signals_generic below stays as the readable
+        # reference implementation
+        key = (symbol, short_window, long_window, trade_qty)
+        fn = _SPECIALIZED_CACHE.get(key)
+        if fn is None:
+            ns: Dict[str, object] = {"_debug_skip_sell": _debug_skip_sell,
+                                     "_SIGNAL_TABLE": self._SIGNAL_TABLE}
+            exec(compile(_MA_SIGNALS_TEMPLATE.format(
+                symbol=symbol, short_w=short_window, long_w=long_window, qty=trade_qty,
+                inv_short=1.0 / short_window, inv_long=1.0 / long_window),
+                f"<specialized generate_signals {symbol}>", "exec"), ns)
+            fn = _SPECIALIZED_CACHE[key] = ns["generate_signals"]
+        self.generate_signals = types.MethodType(fn, self)
 
-    @staticmethod
-    def _mean(seq) -> float:
-        return sum(seq) / float(len(seq))
+    @property
+    def trade_qty(self) -> int:
+        return self._qty
 
-    def generate_signals(self, tick, positions=None) -> List[Signal]:
-        if tick.symbol != self.symbol:
+    @property
+    def lookback(self) -> int:
+        """Number of past ticks this strategy needs to see."""
+        return self._long_w
+
+    def precompute(self, prices):
+        if kernels is None:
+            return None
+        return kernels.ma_crossover_signals(prices, self._short_w, self._long_w)
+
+    @classmethod
+    def specialize(cls, short_window: int, long_window: int, trade_qty: int = 1):
+        """Return a subclass with the parameters baked in; instances take
+        only the symbol. Sweep code can build one specialized class per
+        (short, long, qty) grid point and stamp out per-symbol instances
+        from it, all sharing one compiled tick handler per symbol."""
+        if not (1 <= short_window < long_window):
+            raise ValueError("Require 1 <= short_window < long_window")
+
+        def __init__(self, symbol: str) -> None:
+            MovingAverageCrossover.__init__(self, symbol, short_window, long_window, trade_qty)
+
+        name = f"{cls.__name__}_{short_window}_{long_window}_q{trade_qty}"
+        return type(name, (cls,), {"__slots__": (), "__init__": __init__})
+
+    @classmethod
+    def compute_ma_signals_vec(cls, prices, short_window, long_window):
+        """Vectorized signal batch for a whole price array, without an
+        instance: +1 BUY / -1 SELL / 0 per tick via the cumulative-sum
+        rolling means in kernels. Raises RuntimeError when numpy-backed
+        kernels are unavailable."""
+        if kernels is None:
+            raise RuntimeError("vectorized signals require numpy (kernels module)")
+        return kernels.ma_crossover_signals(prices, short_window, long_window)
+
+    @classmethod
+    def from_series(cls, prices, short_window: int = 5, long_window: int = 20):
+        """Research-path batch frame: price, rolling short/long means,
+        their diff and the +1/-1/0 crossover signal as DataFrame columns.
+        The moving averages come from pandas' rolling kernels; the signal
+        column is taken from kernels.ma_crossover_signals so it stays
+        tick-for-tick consistent with the event-driven path."""
+        if pd is None or kernels is None:
+            raise RuntimeError("from_series requires pandas and numpy")
+        if not (1 <= short_window < long_window):
+            raise ValueError("Require 1 <= short_window < long_window")
+        prices = pd.Series(prices, dtype="float64", name="price")
+        short_ma = prices.rolling(short_window).mean()
+        long_ma = prices.rolling(long_window).mean()
+        return pd.DataFrame({
+            "price": prices,
+            "short_ma": short_ma,
+            "long_ma": long_ma,
+            "diff": short_ma - long_ma,
+            "signal": kernels.ma_crossover_signals(
+                prices.to_numpy(), short_window, long_window),
+        })
+
+    def generate_signals_vectorized(self, prices):
+        """Event-loop-free batch twin of generate_signals: compute every
+        crossover over the full price column in one pass and return the
+        aligned (sides, prices, indices) event arrays. Position gating and
+        execution are the caller's concern, as in engine.run_vectorized."""
+        if kernels is None:
+            raise RuntimeError("vectorized signals require numpy (kernels module)")
+        sig = kernels.ma_crossover_signals(prices, self._short_w, self._long_w)
+        return kernels.signal_events(sig, prices)
+
+    def generate_signals_generic(self, tick, positions=None) -> List[Signal]:
+        # Bind everything read more than once to locals up front: slot
+        # loads are cheap but not free, and this runs once per tick
+        symbol = tick.symbol
+        if symbol != self.symbol:
             return []
         price = float(tick.price)
-        self._prices.append(price)
-        if len(self._prices) < self._long_w:
+        short_w = self._short_w
+        long_w = self._long_w
+        n = self._n
+        self._n = n + 1
+        sbuf = self._short_buf
+        sh = self._short_head
+        ssum = self._short_sum
+        if n >= short_w:
+            ssum -= sbuf[sh]
+        sbuf[sh] = price
+        self._short_head = sh + 1 if sh + 1 < short_w else 0
+        ssum += price
+        self._short_sum = ssum
+        lbuf = self._long_buf
+        lh = self._long_head
+        lsum = self._long_sum
+        if n >= long_w:
+            lsum -= lbuf[lh]
+        lbuf[lh] = price
+        self._long_head = lh + 1 if lh + 1 < long_w else 0
+        lsum += price
+        self._long_sum = lsum
+        if n + 1 < long_w:
             return []
 
-        short_ma = self._mean(list(self._prices)[-self._short_w:])
-        long_ma  = self._mean(self._prices)
-        diff = short_ma - long_ma
+        diff = ssum * self._inv_short - lsum * self._inv_long
 
         out: List[Signal] = []
-        if self._prev_diff is not None:
-            # cross up -> BUY
-            if self._prev_diff <= 0 and diff > 0:
-                out.append(("BUY", tick.symbol, self._qty, price))
-            # cross down -> SELL (position-aware)
-            elif self._prev_diff >= 0 and diff < 0:
-                qty = int(positions.get(tick.symbol, {}).get("quantity", 0)) if positions else 0
-                sell_qty = min(self._qty, qty)
+        prev = self._prev_diff
+        if prev is not None:
+            action = self._SIGNAL_TABLE.get(((prev > 0) - (prev < 0), (diff > 0) - (diff < 0)))
+            if action == "BUY":  # cross up
+                out.append(("BUY", symbol, self._qty, price))
+            elif action is not None:  # cross down -> SELL (position-aware)
+                qty = self._qty
+                pos = positions.get(symbol) if positions else None
+                held = int(pos["quantity"]) if pos else 0
+                sell_qty = min(qty, held)
                 if sell_qty > 0:
-                    out.append(("SELL", tick.symbol, sell_qty, price))
+                    out.append(("SELL", symbol, sell_qty, price))
+                else:
+                    _debug_skip_sell(symbol, held, qty)
         self._prev_diff = diff
         return out
 
 class Momentum(Strategy):
+    __slots__ = ("symbol", "_window", "_th", "_th_up", "_th_dn",
+                 "_buf", "_head", "_count", "_qty")
+
     def __init__(self, symbol: str, lookback: int = 10, threshold_pct: float = 0.01, trade_qty: int = 1) -> None:
         if lookback < 1:
             raise ValueError("lookback must be >= 1")
@@ -60,28 +361,71 @@ class Momentum(Strategy):
         self.symbol = symbol
         self._window = lookback
         self._th = threshold_pct
-        self._prices: Deque[float] = deque(maxlen=lookback+1)  # need past & now
+        # Precomputed comparison factors: now >= past * (1 + th) replaces
+        # the per-tick divide in (now - past) / past >= th
+        self._th_up = 1.0 + threshold_pct
+        self._th_dn = 1.0 - threshold_pct
+        # Preallocated ring buffer of the last lookback+1 prices (need
+        # past & now): contiguous doubles with an integer head, so both the
+        # departing and arriving prices are O(1) slot accesses
+        self._buf = array("d", [0.0] * (lookback + 1))
+        self._head = 0
+        self._count = 0
         self._qty = trade_qty
 
+    @property
+    def trade_qty(self) -> int:
+        return self._qty
+
+    @property
+    def lookback(self) -> int:
+        """Number of past ticks this strategy needs to see."""
+        return self._window + 1  # need past & now
+
+    def precompute(self, prices):
+        if kernels is None:
+            return None
+        return kernels.momentum_signals(prices, self._window, self._th)
+
+    @classmethod
+    def compute_momentum_signals_vec(cls, prices, lookback, threshold_pct):
+        """Vectorized signal batch for a whole price array, without an
+        instance: +1 BUY / -1 SELL / 0 per tick from the lookback-shifted
+        relative change. Raises RuntimeError when numpy-backed kernels are
+        unavailable."""
+        if kernels is None:
+            raise RuntimeError("vectorized signals require numpy (kernels module)")
+        return kernels.momentum_signals(prices, lookback, threshold_pct)
+
     def generate_signals(self, tick, positions=None) -> List[Signal]:
-        if tick.symbol != self.symbol:
-            return []
-        self._prices.append(float(tick.price))
-        if len(self._prices) < self._prices.maxlen:
+        symbol = tick.symbol
+        if symbol != self.symbol:
             return []
+        now = float(tick.price)
+        buf = self._buf
+        size = self._window + 1
+        head = self._head
+        buf[head] = now  # overwrite the evicted oldest price in place
+        head += 1
+        if head == size:
+            head = 0
+        self._head = head
+        if self._count < size:
+            self._count += 1
+            if self._count < size:
+                return []
+        past = buf[head]  # head now points at the oldest retained price
 
-        past = self._prices[0]
-        now  = self._prices[-1]
-        if past <= 0:
+        code = _momentum_decide(now, past, self._th_up, self._th_dn)
+        if code == 0:
             return []
-
-        change = (now - past) / past
-        out: List[Signal] = []
-        if change >= self._th:
-            out.append(("BUY", tick.symbol, self._qty, now))
-        elif change <= -self._th:
-            qty = int(positions.get(tick.symbol, {}).get("quantity", 0)) if positions else 0
-            sell_qty = min(self._qty, qty)
-            if sell_qty > 0:
-                out.append(("SELL", tick.symbol, sell_qty, now))
-        return out
+        qty = self._qty
+        if code > 0:
+            return [("BUY", symbol, qty, now)]
+        pos = positions.get(symbol) if positions else None
+        held = int(pos["quantity"]) if pos else 0
+        sell_qty = min(qty, held)
+        if sell_qty > 0:
+            return [("SELL", symbol, sell_qty, now)]
+        _debug_skip_sell(symbol, held, qty)
+        return []